@@ -1,11 +1,10 @@
 import abc
 import dataclasses
-import math
 import typing as ty
 
 from perudo import common
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Action(common.BaseFrozen):
     """
     All player actions should subclass this
@@ -46,7 +45,7 @@ class Action(common.BaseFrozen):
         return ToRegister
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EndAction(Action):
     """
     Actions that end a round should subclass this
@@ -90,7 +89,7 @@ class EndAction(Action):
         raise NotImplementedError('Implement me bro.')
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class InvalidAction(EndAction):
     """
     Always Fails. Contains what the action that failed was
@@ -123,7 +122,7 @@ class InvalidAction(EndAction):
     ) -> 'EndAction':
         return self
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class NoOp(Action):
     """
     Player took no action - see subclasses for reasons why
@@ -140,7 +139,7 @@ class NoOp(Action):
         # Todo: should this be always invalid instead?
         raise RuntimeError(f'{type(self).__name__} should not call validate')
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class NoOpFirstTurnSkip(NoOp):
     """
     NoOp for alignment - if the first player is index 2, players 0 and 1
@@ -149,7 +148,7 @@ class NoOpFirstTurnSkip(NoOp):
     subclass of NoOp so isinstance(action, NoOp) is True
     """
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class NoOpDead(NoOp):
     """
     Player didn't take an action because they are dead. This action is recorded
@@ -158,8 +157,50 @@ class NoOpDead(NoOp):
     subclass of NoOp so isinstance(action, NoOp) is True
     """
 
+def _get_min_next_count_rule(face: int, next_face: int) -> ty.Callable[[int], int]:
+    """
+    Which rule gives the minimum count for a bid on next_face following a bid
+    on face. Only used to build _MIN_NEXT_COUNT_RULES.
+    """
+    if next_face == face:
+        return lambda count: count + 1
+    if next_face > face and face != common.WILD_FACE_VAL:
+        return lambda count: count  # + 1 # TODO This might be wrong, but it stops some infinite loops.
+    if next_face == common.WILD_FACE_VAL:
+        return lambda count: (count + 1) // 2  # ceil(count / 2)
+    if face == common.WILD_FACE_VAL:
+        return lambda count: count * 2 + 1
+    return lambda count: (count + 1) // 2 * 2 + 1
+
+
+# Indexed by [face - MIN_FACE_VAL][next_face - MIN_FACE_VAL]. The rule only
+# depends on the two faces, so pick it once here instead of on every call.
+_MIN_NEXT_COUNT_RULES: tuple[tuple[ty.Callable[[int], int], ...], ...] = tuple(
+    tuple(
+        _get_min_next_count_rule(face, next_face)
+        for next_face in range(common.MIN_FACE_VAL, common.MAX_FACE_VAL + 1)
+    )
+    for face in range(common.MIN_FACE_VAL, common.MAX_FACE_VAL + 1)
+)
+
+
+def _get_min_next_counts(face: int, count: int) -> tuple[int, ...]:
+    return tuple(rule(count) for rule in _MIN_NEXT_COUNT_RULES[face - common.MIN_FACE_VAL])
+
+
+# Bids with counts below this (which covers every bid that can be true in a
+# game of up to 20 players) have their min next counts precomputed in
+# _MIN_NEXT_COUNTS_TABLE. Bigger bids fall back to the rules.
+_MIN_NEXT_COUNTS_TABLE_SIZE = 20 * common.STARTING_NUM_DICE + 1
+# Indexed by [face - MIN_FACE_VAL][count][next_face - MIN_FACE_VAL]
+_MIN_NEXT_COUNTS_TABLE: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(_get_min_next_counts(face, count) for count in range(_MIN_NEXT_COUNTS_TABLE_SIZE))
+    for face in range(common.MIN_FACE_VAL, common.MAX_FACE_VAL + 1)
+)
+
+
 @Action.register_action
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Bid(Action):
     ACTION_NAME: ty.ClassVar[str] = 'Bid'
     face: int
@@ -200,15 +241,30 @@ class Bid(Action):
     def min_next_count(self, next_face: int) -> int:
         assert common.validate_face(next_face)
         assert common.validate_face(self.face)
-        if next_face == self.face:
-            return self.count + 1
-        if next_face > self.face and self.face != common.WILD_FACE_VAL:
-            return self.count  # + 1 # TODO This might be wrong, but it stops some infinite loops.
-        if next_face == common.WILD_FACE_VAL:
-            return math.ceil(self.count / 2)
-        if self.face == common.WILD_FACE_VAL:
-            return self.count * 2 + 1
-        return math.ceil(self.count / 2) * 2 + 1
+        if 0 <= self.count < _MIN_NEXT_COUNTS_TABLE_SIZE:
+            return _MIN_NEXT_COUNTS_TABLE[self.face - common.MIN_FACE_VAL][self.count][next_face - common.MIN_FACE_VAL]
+        rule = _MIN_NEXT_COUNT_RULES[self.face - common.MIN_FACE_VAL][next_face - common.MIN_FACE_VAL]
+        return rule(self.count)
+
+    def min_next_counts(self) -> tuple[int, ...]:
+        """
+        min_next_count for every face at once, in the order of
+        common.ALL_FACES
+        """
+        assert common.validate_face(self.face)
+        if 0 <= self.count < _MIN_NEXT_COUNTS_TABLE_SIZE:
+            return _MIN_NEXT_COUNTS_TABLE[self.face - common.MIN_FACE_VAL][self.count]
+        return _get_min_next_counts(self.face, self.count)
+
+    def count_matching_dice(self, all_dice_counts: common.DiceCounts, is_single_die_round: bool) -> int:
+        """
+        How many of the dice count towards this bid (wilds included, unless
+        it's a single die round).
+        """
+        num_matching = all_dice_counts[self.face]
+        if not is_single_die_round and self.face != common.WILD_FACE_VAL:
+            num_matching += all_dice_counts[common.WILD_FACE_VAL]
+        return num_matching
 
     @classmethod
     def get_from_human(cls, fixed_face: int | None) -> ty.Self:
@@ -224,7 +280,7 @@ class Bid(Action):
 
 
 @Action.register_action
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Challenge(EndAction):
     ACTION_NAME: ty.ClassVar[str] = 'Challenge'
     def validate(
@@ -253,9 +309,7 @@ class Challenge(EndAction):
             )
             return [caller]
 
-        num_existing = all_dice_counts[previous_action.face]
-        if not is_single_die_round and previous_action.face != common.WILD_FACE_VAL:
-            num_existing += all_dice_counts[common.WILD_FACE_VAL]
+        num_existing = previous_action.count_matching_dice(all_dice_counts, is_single_die_round)
 
         if num_existing < previous_action.count:
             return [previous_player]
@@ -263,7 +317,7 @@ class Challenge(EndAction):
 
 
 @Action.register_action
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Exact(EndAction):
     ACTION_NAME: ty.ClassVar[str] = 'Exact'
 
@@ -285,9 +339,7 @@ class Exact(EndAction):
             )
             return [caller]
 
-        num_existing = all_dice_counts[previous_action.face]
-        if not is_single_die_round and previous_action.face != common.WILD_FACE_VAL:
-            num_existing += all_dice_counts[common.WILD_FACE_VAL]
+        num_existing = previous_action.count_matching_dice(all_dice_counts, is_single_die_round)
 
         if num_existing == previous_action.count:
             return list(other_players)
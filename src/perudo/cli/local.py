@@ -6,6 +6,10 @@ can be run directly, or through cli_main.py or __main__.py
 
 import argparse
 import collections
+import concurrent.futures
+import functools
+import os
+import random
 import sys
 
 from perudo.cli import cli_common as cc
@@ -15,6 +19,10 @@ from perudo import players as pl
 
 DESCRIPTION: str = '- Play a local game of Perudo.'
 
+# (player name, registered constructor name). Players are passed around as
+# these rather than as objects so that they can be sent to worker processes.
+type PlayerSpec = tuple[str, str]
+
 def make_parser(parser: argparse.ArgumentParser | None=None) -> argparse.ArgumentParser:
     if parser is None:
         parser = argparse.ArgumentParser(description=DESCRIPTION)
@@ -52,51 +60,132 @@ def make_parser(parser: argparse.ArgumentParser | None=None) -> argparse.Argumen
         dest='print_non_human_dice',
         help='Do not print dice assignments for non-human players'
     )
+    parser.add_argument(
+        '--n-games',
+        type=int,
+        dest='num_games',
+        default=1,
+        help='Number of games to play. If more than 1, games are played silently '
+             '(in parallel) and only the win counts are printed. No humans allowed.'
+    )
+    parser.add_argument(
+        '--n-workers',
+        type=int,
+        dest='num_workers',
+        default=None,
+        help='Number of processes to play games in if --n-games is more than 1 '
+             '(default: number of CPUs)'
+    )
 
     return parser
 
+def _play_one(seed: int, player_specs: list[PlayerSpec]) -> str:
+    """
+    Play one silent game (for batch runs) and return the winner's name.
+    """
+    random.seed(seed)
+    players = [
+        pl.PlayerABC.from_constructor(player_name=player_name, constructor=constructor_name)
+        for player_name, constructor_name in player_specs
+    ]
+    game = pg.PerudoGame.from_player_list(
+        players=players,
+        print_while_playing=False,
+        record_history=False,
+    )
+    return game.players[game.main_loop()].name
+
+def run_many_games(
+    player_specs: list[PlayerSpec],
+    num_games: int,
+    num_workers: int | None = None,
+) -> collections.Counter[str]:
+    """
+    Play num_games independent games across worker processes.
+
+    Note that players are built in the workers from the constructor registry,
+    so custom player classes need to be registered when perudo is imported
+    there too (or the workers must be forked, the default on Linux).
+
+    :return: Number of wins by player name
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    first_seed = random.randrange(2**32)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        winners = executor.map(
+            functools.partial(_play_one, player_specs=player_specs),
+            range(first_seed, first_seed + num_games),
+            chunksize=max(1, num_games // (num_workers * 4)),
+        )
+        return collections.Counter(winners)
+
 def main(args: argparse.Namespace | None = None) -> int:
     if args is None:
         parser = make_parser()
         args = parser.parse_args()
 
-    players: list[pl.PlayerABC] = [
-        pl.RandomLegalPlayer(
-            name=f'Rando-{index}'
-        )
+    player_specs: list[PlayerSpec] = [
+        (f'Rando-{index}', pl.RandomLegalPlayer.__name__)
         for index in range(max(0, args.num_random_players))
     ]
-    players.extend(
-        pl.ProbabilisticPlayer(
-            name=f'Prob-{index}'
-        )
+    player_specs.extend(
+        (f'Prob-{index}', pl.ProbabilisticPlayer.__name__)
         for index in range(max(0, args.num_prob_players))
     )
-    players.extend(
-        (
-            pl.HumanPlayer(name=human_name)
-            for human_name in args.human_names
-        )
+    player_specs.extend(
+        (human_name, pl.HumanPlayer.__name__)
+        for human_name in args.human_names
     )
 
     arbitrary_class_counts: collections.Counter[str] = collections.Counter(args.arbitrary_player_classes)
     for player_class, count in arbitrary_class_counts.items():
-        players.extend(
-            pl.PlayerABC.from_constructor(
-                player_name=f'Arb-{player_class}-{index}',
-                constructor=player_class,
-            )
+        player_specs.extend(
+            (f'Arb-{player_class}-{index}', player_class)
             for index in range(count)
         )
 
-    if len(players) < 2:
+    if len(player_specs) < 2:
         print("Need at least 2 players")
         return 1
 
-    if len({player.name for player in players}) != len(players):
+    if len({player_name for player_name, _ in player_specs}) != len(player_specs):
         print("Player names must be unique")
         return 1
 
+    if args.num_games < 1:
+        print("Need at least 1 game")
+        return 1
+
+    if args.num_workers is not None and args.num_workers < 1:
+        print("Need at least 1 worker")
+        return 1
+
+    if args.num_games > 1:
+        # Resolve every constructor here rather than in the workers, so that
+        # unknown names fail up front, and human players (who would wait on
+        # input in a worker forever) are caught however they were added.
+        for player_name, constructor_name in player_specs:
+            try:
+                constructor = pl.PlayerABC.resolve(constructor_name)
+            except KeyError:
+                print(f"Unknown player constructor {constructor_name!r} for {player_name}")
+                return 1
+            # Registered classes are stored as their from_name classmethod
+            constructor_class = getattr(constructor, '__self__', None)
+            if isinstance(constructor_class, type) and issubclass(constructor_class, pl.HumanPlayer):
+                print("Can't play multiple games with human players")
+                return 1
+        wins = run_many_games(player_specs, args.num_games, args.num_workers)
+        for player_name, num_wins in wins.most_common():
+            print(f"{player_name}: {num_wins} wins ({num_wins / args.num_games:.1%})")
+        return 0
+
+    players = [
+        pl.PlayerABC.from_constructor(player_name=player_name, constructor=constructor_name)
+        for player_name, constructor_name in player_specs
+    ]
+
     game = pg.PerudoGame.from_player_list(
         players=players,
         print_while_playing=args.print_while_playing,
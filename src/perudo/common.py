@@ -14,6 +14,8 @@ MIN_FACE_VAL = 1
 MAX_FACE_VAL = 6
 NUM_FACES = MAX_FACE_VAL - MIN_FACE_VAL + 1
 STARTING_NUM_DICE = 5
+ALL_FACES = tuple(range(MIN_FACE_VAL, MAX_FACE_VAL + 1))
+NON_WILD_FACES = tuple(face for face in ALL_FACES if face != WILD_FACE_VAL)
 assert NUM_FACES > 1, "Can't have only one face"
 # may remove this restriction later, but some code would have to change
 assert MIN_FACE_VAL <= WILD_FACE_VAL <= MAX_FACE_VAL, "Wild card must be in range"
@@ -23,6 +25,12 @@ assert WILD_FACE_VAL == MIN_FACE_VAL, "Wild card must be first"  # TODO fix bid
 def validate_face(face: int) -> bool:
     return MIN_FACE_VAL <= face <= MAX_FACE_VAL
 
+def mask_to_bools(mask: int, num_bits: int) -> list[bool]:
+    """
+    Expand an integer used as a bitset into a list of bools, lowest bit first.
+    """
+    return [bool(mask >> bit & 1) for bit in range(num_bits)]
+
 def exception_to_str(exception: Exception) -> str:
     return ''.join(traceback.format_exception(type(exception), exception, exception.__traceback__))
 
@@ -64,10 +72,7 @@ def get_random_face() -> int:
     return random.randint(MIN_FACE_VAL, MAX_FACE_VAL)
 
 def get_random_non_wild_face() -> int:
-    face = get_random_face()
-    while face == WILD_FACE_VAL:
-        face = get_random_face()
-    return face
+    return random.choice(NON_WILD_FACES)
 
 
 # pyright: reportUnknownVariableType=false, reportUnknownArgumentType=false
@@ -119,7 +124,7 @@ def _is_instance_of_typehint(obj: object, hint: ty.Any) -> bool:
 
     raise TypeError(f"Unsupported type hint: {hint} ({origin=}, {args=})")
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class BaseFrozen:
     """
     Represents a base frozen dataclass with type validation and utility methods for
@@ -132,6 +137,14 @@ class BaseFrozen:
     This immutable dataclass validates the types of its attributes upon initialization.
     It provides methods to create an instance from a dictionary or a JSON string and
     to convert the instance into a dictionary or a JSON string.
+
+    Slotted, as are the actions - subclasses that don't declare slots
+    themselves just get a __dict__ as usual.
+
+    The check on initialization is skipped under python -O, since these objects
+    are created constantly during play. Objects built from dictionaries/JSON
+    (ie anything that came over the network) are still checked field by field
+    in data_from_data_dict either way.
     """
     SUBCLASS_REGISTRY: ty.ClassVar[dict[str, type['BaseFrozen']]] = {}
     TYPE_KEY: ty.ClassVar[str] = 'TYPE'
@@ -140,18 +153,27 @@ class BaseFrozen:
     MAGIC_VALUE: ty.ClassVar[str] = '__MAGIC_BASE_FROZEN_VALUE__'
 
     def __init_subclass__(cls) -> None:
-        super().__init_subclass__()
-        if cls.__name__ in cls.SUBCLASS_REGISTRY:
+        # Explicit super arguments, because slots=True replaces this class
+        # after the method is defined, which breaks the zero argument form.
+        super(BaseFrozen, cls).__init_subclass__()
+        existing = cls.SUBCLASS_REGISTRY.get(cls.__name__)
+        # dataclass(slots=True) replaces the decorated class with a new class of
+        # the same name, which ends up here a second time. The new one wins.
+        if existing is not None and (
+            (existing.__module__, existing.__qualname__) != (cls.__module__, cls.__qualname__)
+        ):
             raise TypeError(f"Duplicate class name {cls.__name__} in SUBCLASS_REGISTRY")
         cls.SUBCLASS_REGISTRY[cls.__name__] = cls
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         errors: list[str] = []
-        for field in dataclasses.fields(self):
-            value = getattr(self, field.name)
-            if not _is_instance_of_typehint(value, field.type):
+        for field_name, field_type in _get_field_types(type(self)).items():
+            value = getattr(self, field_name)
+            if not _is_instance_of_typehint(value, field_type):
                 errors.append(
-                    f'Field {field.name} expected type {field.type}, but got '
+                    f'Field {field_name} expected type {field_type}, but got '
                     f'object {value} of type {type(value)}.'
                 )
         if errors:
@@ -188,10 +210,7 @@ class BaseFrozen:
 
             # really always a type dict[str, type], but that's handled below
             # to keep type checking happy.
-            field_name_to_type_d: dict[str, ty.Any] = {
-                field.name: field.type
-                for field in dataclasses.fields(cls)
-            }
+            field_name_to_type_d = _get_field_types(cls)
 
             for field_name, value in input_d.items():
                 if field_name not in field_name_to_type_d:
@@ -274,24 +293,46 @@ class BaseFrozen:
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
 
-def _naive_base_frozen_to_d(thing: BaseFrozen) -> dict[str, ty.Any]:
-    return {
-        BaseFrozen.TYPE_KEY: type(thing).__name__,
-        BaseFrozen.DATA_KEY: {
-            field.name: getattr(thing, field.name)
-            for field in dataclasses.fields(thing)
-        },
-        BaseFrozen.MAGIC_KEY: BaseFrozen.MAGIC_VALUE,
-    }
+_FIELD_TYPES_BY_CLASS: dict[type[BaseFrozen], dict[str, ty.Any]] = {}
+
+def _get_field_types(cls: type[BaseFrozen]) -> dict[str, ty.Any]:
+    """
+    Field name to type hint for a BaseFrozen subclass, looked up once per
+    class and shared by encoding and decoding - don't modify the result.
+    (Can't be done in __init_subclass__, which runs before the dataclass
+    decorator has added the fields.)
+    """
+    try:
+        return _FIELD_TYPES_BY_CLASS[cls]
+    except KeyError:
+        field_types = _FIELD_TYPES_BY_CLASS[cls] = {
+            field.name: field.type
+            for field in dataclasses.fields(cls)
+        }
+        return field_types
+
+# Exact types that are already jsonable, checked first since they're most of
+# what gets serialized. Subclasses of these still go through the isinstance
+# checks below.
+_JSONABLE_SCALAR_TYPES = frozenset({str, float, int, bytes, bool, type(None)})
 
 def _to_jsonable_hopefully(thing: object) -> ty.Any:
+    if type(thing) in _JSONABLE_SCALAR_TYPES:
+        return thing
+
     if isinstance(thing, list):
         return [_to_jsonable_hopefully(element) for element in thing]
 
     if isinstance(thing, BaseFrozen):
-        return _to_jsonable_hopefully(
-            _naive_base_frozen_to_d(thing)
-        )
+        # Keys are known strings, so only the field values need converting
+        return {
+            BaseFrozen.TYPE_KEY: type(thing).__name__,
+            BaseFrozen.DATA_KEY: {
+                field_name: _to_jsonable_hopefully(getattr(thing, field_name))
+                for field_name in _get_field_types(type(thing))
+            },
+            BaseFrozen.MAGIC_KEY: BaseFrozen.MAGIC_VALUE,
+        }
 
     if isinstance(thing, dict):
         return {
@@ -347,18 +388,41 @@ class DiceCounts(BaseFrozen):
 
     @classmethod
     def from_random(cls, num_dice: int) -> ty.Self:
+        # One choices call for all the dice, drawing offsets from MIN_FACE_VAL
+        # directly, instead of a randint per die.
         dice_counts = [0 for _ in range(NUM_FACES)]
-        for _ in range(num_dice):
-            dice_counts[get_random_face() - MIN_FACE_VAL] += 1
+        for offset in random.choices(range(NUM_FACES), k=num_dice):
+            dice_counts[offset] += 1
         return cls(dice_counts)
 
+    @classmethod
+    def list_from_random(cls, nums_dice: ty.Sequence[int]) -> list[ty.Self]:
+        """
+        Roll dice for several players at once, with a single choices call for
+        all of them (rather than one per player).
+
+        :param nums_dice: How many dice each player has
+        :return: One DiceCounts per entry of nums_dice
+        """
+        offsets = random.choices(range(NUM_FACES), k=sum(nums_dice))
+        all_dice_counts: list[ty.Self] = []
+        start = 0
+        for num_dice in nums_dice:
+            dice_counts = [0 for _ in range(NUM_FACES)]
+            for offset in offsets[start:start + num_dice]:
+                dice_counts[offset] += 1
+            start += num_dice
+            all_dice_counts.append(cls(dice_counts))
+        return all_dice_counts
+
     @classmethod
     def from_multi_counts(cls, dice_counts_s: ty.Iterable[ty.Self]) -> ty.Self:
-        dice_counts = [0 for _ in range(NUM_FACES)]
-        for source in dice_counts_s:
-            for face in range(MIN_FACE_VAL, MAX_FACE_VAL + 1):
-                dice_counts[face - MIN_FACE_VAL] += source[face]
-        return cls(dice_counts)
+        # Sum the underlying lists column-wise (one column per face), rather
+        # than indexing face by face.
+        sources = [source._counts for source in dice_counts_s]
+        if not sources:
+            return cls.from_empty()
+        return cls([sum(face_counts) for face_counts in zip(*sources)])
 
     @classmethod
     def from_dictionary(cls, count_d: dict[int, int]) -> ty.Self:
@@ -378,6 +442,13 @@ class DiceCounts(BaseFrozen):
     def get_num_dice(self) -> int:
         return sum(self._counts)
 
+    def to_face_indexed_tuple(self) -> tuple[int, ...]:
+        """
+        The counts as a tuple indexed directly by face (entries below
+        MIN_FACE_VAL are 0), for code that reads counts in a tight loop.
+        """
+        return (0,) * MIN_FACE_VAL + tuple(self._counts)
+
     def to_str(self) -> str:
         return ', '.join(
             f'{face}: {value}'
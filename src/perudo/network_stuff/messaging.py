@@ -30,7 +30,7 @@ class WrappedMessage:
     SALT_LEN: ty.ClassVar[int] = 32
     RECEIVED_SALTS: ty.ClassVar[collections.defaultdict[bytes, set[bytes]]] = collections.defaultdict(set)
     SENT_SALTS: ty.ClassVar[set[bytes]] = set()
-    VERSION: ty.ClassVar[str] = "0.1"
+    VERSION: ty.ClassVar[str] = "0.2"
 
     salt: bytes
     public_key: ed25519.Ed25519PublicKey
@@ -16,15 +16,22 @@ Key game rules:
 """
 
 import dataclasses
+import io
 import random
+import sys
 import typing as ty
 
 from perudo import common
 from perudo import actions
 from perudo import players as pl
 
+# The NoOp markers have no fields, so single instances can be shared by every
+# skipped or dead seat instead of allocating new ones each turn.
+_NOOP_FIRST_TURN_SKIP = actions.NoOpFirstTurnSkip()
+_NOOP_DEAD = actions.NoOpDead()
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True, eq=False)
 class PerudoGame:
     """
     Represents a game of Perudo.
@@ -41,43 +48,138 @@ class PerudoGame:
     these itself. This makes things a bit more clunky, but it means that extensions of player
     classes are less likely to break the game logic.
 
+    Uses slots, since batch simulations create a lot of these. Subclasses that
+    want a __dict__ have to ask for it.
+
     I have no idea what the below syntax means or what system it is for, but it's what the AI did,
     and I'm leaving it until I get around to replacing it with something more compact.
     """
     players: list[pl.PlayerABC]
-    num_dice_by_player_history: list[list[int]] = dataclasses.field(default_factory=list[list[int]])
+    # The list factories are lambda: [] because calling list[X]() goes through
+    # typing machinery (~10x slower than a bare list), and a bare list makes
+    # pyright's strict mode unhappy about unknown types.
+    num_dice_by_player_history: list[list[int]] = dataclasses.field(default_factory=lambda: [])
     cur_player_index: int = -1
     cur_round_single_die: bool = False
-    all_rounds_actions: list[list[actions.Action]] = dataclasses.field(default_factory=list[list[actions.Action]])
-    all_rounds_dice_counts: list[list[common.DiceCounts]] = dataclasses.field(default_factory=list[list[common.DiceCounts]])
-    all_rounds_losers: list[list[int]] = dataclasses.field(default_factory=list[list[int]])
-    single_die_round_history: list[bool] = dataclasses.field(default_factory=list[bool])
+    # The last bid of the current round (None before the first), kept up to
+    # date in take_turn so it doesn't have to be searched for
+    cur_round_last_bid: actions.Bid | None = dataclasses.field(default=None, init=False)
+    all_rounds_actions: list[list[actions.Action]] = dataclasses.field(default_factory=lambda: [])
+    all_rounds_dice_counts: list[list[common.DiceCounts]] = dataclasses.field(default_factory=lambda: [])
+    all_rounds_losers: list[list[int]] = dataclasses.field(default_factory=lambda: [])
+    # Bitset of which rounds were single die rounds (bit i is round i). Kept as
+    # an int rather than a list[bool], since archived games can be large.
+    _single_die_mask: int = dataclasses.field(default=0, init=False)
+    _round_count: int = dataclasses.field(default=0, init=False)
+    # The last entries of all_rounds_actions and all_rounds_dice_counts, held
+    # directly since they're used every turn.
+    _cur_actions: list[actions.Action] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+    _cur_dice: list[common.DiceCounts] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
     print_while_playing: bool = False
     print_non_human_dice: bool = True
     hide_noops: bool = False
+    # If False, only the current round is kept in the history lists. Useful for
+    # batch simulations that only care who won.
+    record_history: bool = True
+    # Players whose class overrides react_to_round_summary. Set in __post_init__
+    _round_summary_players: list[pl.PlayerABC] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+    _print_buffer: io.StringIO = dataclasses.field(default_factory=io.StringIO, init=False, repr=False)
+    # Player names by index, fixed for the game. Set in __post_init__
+    _names: list[str] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+    _typed_names: list[str] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+    # Whether each player's actions need validating (see PlayerABC.ACTIONS_ARE_TRUSTED)
+    _validate_actions: list[bool] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+    # Ring of living player indexes (doubly linked through these two lists),
+    # so finding the next/previous living player doesn't scan past the dead.
+    # Dead players are unlinked in end_round but keep their own links, which
+    # always lead to players that were alive after them - so following links
+    # from a dead player still reaches the nearest living one.
+    _next_living: list[int] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+    _prev_living: list[int] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+    # How many players have dice left. Set in __post_init__, kept up to date
+    # in end_round
+    _num_living_players: int = dataclasses.field(default=0, init=False, repr=False)
+    # Total dice in play this round. Set in start_new_round
+    _num_dice_in_play: int = dataclasses.field(default=0, init=False, repr=False)
+    # The dice of every finished round (all_rounds_dice_counts without the
+    # current round). Set in start_new_round rather than sliced every turn
+    _dice_reveal_history: list[list[common.DiceCounts]] = dataclasses.field(default_factory=lambda: [], init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._round_summary_players = [
+            player for player in self.players
+            if type(player).react_to_round_summary is not pl.PlayerABC.react_to_round_summary
+        ]
+        self._names = [player.name for player in self.players]
+        self._typed_names = [player.typed_name for player in self.players]
+        self._validate_actions = [not player.ACTIONS_ARE_TRUSTED for player in self.players]
+
+        num_players = len(self.players)
+        self._next_living = [(index + 1) % num_players for index in range(num_players)]
+        self._prev_living = [(index - 1) % num_players for index in range(num_players)]
+        self._num_living_players = num_players
+        if self.num_dice_by_player_history:
+            for index, num_dice in enumerate(self.num_dice_by_player_history[-1]):
+                if num_dice == 0:
+                    self._unlink_dead_player(index)
+                    self._num_living_players -= 1
+
+    @property
+    def player_names(self) -> list[str]:
+        return self._names
+
+    @property
+    def num_living_players(self) -> int:
+        return self._num_living_players
+
+    @property
+    def single_die_round_mask(self) -> int:
+        return self._single_die_mask
+
+    @property
+    def single_die_round_history(self) -> list[bool]:
+        return common.mask_to_bools(self._single_die_mask, self._round_count)
 
     @property
     def current_round_actions(self) -> list[actions.Action]:
         if not self.all_rounds_actions:
             raise RuntimeError('No current round')
-        return self.all_rounds_actions[-1]
+        return self._cur_actions
 
     @property
     def current_round_dice_by_player(self) -> list[common.DiceCounts]:
         if not self.all_rounds_actions:
             raise RuntimeError('No current round')
-        return self.all_rounds_dice_counts[-1]
+        return self._cur_dice
+
+    def _unlink_dead_player(self, index: int) -> None:
+        next_index = self._next_living[index]
+        prev_index = self._prev_living[index]
+        self._next_living[prev_index] = next_index
+        self._prev_living[next_index] = prev_index
+
+    def _follow_living_links(self, links: list[int]) -> int:
+        """
+        Follow links (_next_living or _prev_living) from the current player to
+        the first living player. Only takes more than one step if the current
+        player is dead.
+        """
+        num_dice_by_player = self.num_dice_by_player_history[-1]
+        index = links[self.cur_player_index]
+        for _ in range(len(self.players)):
+            if num_dice_by_player[index] != 0:
+                return index
+            index = links[index]
+        return self.cur_player_index  # Nobody alive at all
 
     def get_previous_living_player_index(self) -> int:
         """
         Raises an error if no player (excluding the current player) has any
         dice
         """
-        prev_index = (self.cur_player_index - 1) % len(self.players)
-        while self.num_dice_by_player_history[-1][prev_index] == 0:
-            if prev_index == self.cur_player_index:
-                raise RuntimeError("previous_living_player_index used when there wasn't one")
-            prev_index = (prev_index - 1) % len(self.players)
+        prev_index = self._follow_living_links(self._prev_living)
+        if prev_index == self.cur_player_index:
+            raise RuntimeError("previous_living_player_index used when there wasn't one")
         return prev_index
 
     def get_next_living_player_index(self) -> int:
@@ -85,24 +187,39 @@ class PerudoGame:
         Raises an error if no player (excluding the current player) has any
         dice
         """
-        next_index = (self.cur_player_index + 1) % len(self.players)
-        while self.num_dice_by_player_history[-1][next_index] == 0:
-            if next_index == self.cur_player_index:
-                raise RuntimeError("get_next_living_player_index used when there wasn't one")
-            next_index = (next_index + 1) % len(self.players)
+        next_index = self._follow_living_links(self._next_living)
+        if next_index == self.cur_player_index:
+            raise RuntimeError("get_next_living_player_index used when there wasn't one")
         return next_index
 
     def get_most_recent_non_noop_action(self) -> actions.Bid | None:
-        for prev_action in reversed(self.current_round_actions):
-            if not isinstance(prev_action, actions.NoOp):
-                break
-        else:
-            return None
-        assert isinstance(prev_action, actions.Bid), (
-            "Last action was not a bid. This should never happen. "
-            f"{prev_action=}, {self.current_round_actions=}, {self.all_rounds_actions=}"
-        )
-        return prev_action
+        return self.cur_round_last_bid
+
+    def _print(self, text: str) -> None:
+        """
+        Used instead of print while playing. Output is buffered and written once
+        per round (or when a human needs to see it), rather than once per line.
+        """
+        self._print_buffer.write(text)
+        self._print_buffer.write('\n')
+
+    def _flush_print_buffer(self) -> None:
+        if self._print_buffer.tell():
+            sys.stdout.write(self._print_buffer.getvalue())
+            self._print_buffer.seek(0)
+            self._print_buffer.truncate(0)
+
+    def _discard_history(self) -> None:
+        """
+        Drop everything but the current state from the history lists. Used
+        when record_history is False.
+        """
+        self.all_rounds_actions.clear()
+        self.all_rounds_dice_counts.clear()
+        self.all_rounds_losers.clear()
+        del self.num_dice_by_player_history[:-1]
+        self._single_die_mask = 0
+        self._round_count = 0
 
     def start_new_round(
         self,
@@ -115,26 +232,34 @@ class PerudoGame:
         if self.num_dice_by_player_history[-1][first_player_index] < 1:
             raise RuntimeError(f'Invalid first_player_index {first_player_index} (does not have dice)')
 
-        self.single_die_round_history.append(single_die_round)
+        if not self.record_history:
+            self._discard_history()
+
+        self._single_die_mask |= single_die_round << self._round_count
+        self._round_count += 1
         self.cur_round_single_die = single_die_round
-        self.all_rounds_actions.append([actions.NoOpFirstTurnSkip() for _ in range(first_player_index)])
+        self.cur_round_last_bid = None
+        self._cur_actions = [_NOOP_FIRST_TURN_SKIP] * first_player_index
+        self.all_rounds_actions.append(self._cur_actions)
         self.cur_player_index = first_player_index
 
-        self.all_rounds_dice_counts.append([])
-        for player, num_dice in zip(self.players, self.num_dice_by_player_history[-1]):
-            dice_counts=common.DiceCounts.from_random(num_dice=num_dice)
+        self._num_dice_in_play = sum(self.num_dice_by_player_history[-1])
+        self._cur_dice = common.DiceCounts.list_from_random(self.num_dice_by_player_history[-1])
+        self._dice_reveal_history = self.all_rounds_dice_counts.copy()
+        self.all_rounds_dice_counts.append(self._cur_dice)
+        for player, dice_counts in zip(self.players, self._cur_dice):
             player.set_dice(dice_counts)
-            self.current_round_dice_by_player.append(dice_counts)
 
         if self.print_while_playing:
-            print(f"\nStarting new round ({single_die_round=} num_dice_in_play={sum(self.num_dice_by_player_history[-1])}):\n====================")
+            index_pwidth = len(str(len(self.players) - 1))
+            self._print(f"\nStarting new round ({single_die_round=} num_dice_in_play={self._num_dice_in_play}):\n====================")
             for player_index, (
                 player,
                 player_dice,
                 player_num_dice,
             ) in enumerate(zip(
                 self.players,
-                self.current_round_dice_by_player,
+                self._cur_dice,
                 self.num_dice_by_player_history[-1]
             )):
                 if not self.print_non_human_dice and not isinstance(player, pl.HumanPlayer):
@@ -147,12 +272,11 @@ class PerudoGame:
                 else:
                     first_indicator = ""
 
-                index_pwidth = len(str(len(self.players) - 1))
-                print(
-                    f'{player_index:>{index_pwidth}} - {player.name} '
+                self._print(
+                    f'{player_index:>{index_pwidth}} - {self._names[player_index]} '
                     f'({player_num_dice} dice): {dice_str}{first_indicator}'
                 )
-            print("-------------------")
+            self._print("-------------------")
 
     def end_round(
         self,
@@ -164,36 +288,40 @@ class PerudoGame:
         :param loser_indexes: The players who lose a die at the end of this round
         :return: Whether there's a next round
         """
-        self.all_rounds_losers.append(sorted(loser_indexes))
-        self.num_dice_by_player_history.append(self.num_dice_by_player_history[-1].copy())
+        self._flush_print_buffer()
+        sorted_loser_indexes = list(loser_indexes)
+        if len(sorted_loser_indexes) > 1:  # Usually just the one loser
+            sorted_loser_indexes.sort()
+        self.all_rounds_losers.append(sorted_loser_indexes)
+        num_dice_by_player = self.num_dice_by_player_history[-1].copy()
+        self.num_dice_by_player_history.append(num_dice_by_player)
+
+        # Single pass over the losers: take their dice, and note who survived
+        # and whether anyone is down to their last die.
+        losers_with_dice: list[int] = []
+        single_die_round = False
         for index in loser_indexes:
-            self.num_dice_by_player_history[-1][index] = max(0, self.num_dice_by_player_history[-1][index] - 1)
+            if num_dice_by_player[index] == 0:
+                continue  # Already dead, and already unlinked
+            num_dice = num_dice_by_player[index] - 1
+            num_dice_by_player[index] = num_dice
+            if num_dice > 0:
+                losers_with_dice.append(index)
+                if num_dice == 1:
+                    single_die_round = True
+            else:
+                self._unlink_dead_player(index)
+                self._num_living_players -= 1
 
         # Start a new round if multiple people are still alive
-        if sum(num > 0 for num in self.num_dice_by_player_history[-1]) > 1:
-            losers_with_dice = [
-                index for index in loser_indexes
-                if self.num_dice_by_player_history[-1][index] > 0
-            ]
+        if self._num_living_players > 1:
             # TODO: Is this right?
             if losers_with_dice:
                 next_player = random.choice(losers_with_dice)
             else:
                 next_player = self.get_next_living_player_index()
-            if any(
-                self.num_dice_by_player_history[-1][index] == 1
-                for index in losers_with_dice
-            ):
-                single_die_round = True
-            else:
-                single_die_round = False
 
-            round_summary = RoundSummary.from_game_losers(
-                game=self,
-                losers=[self.players[index] for index in loser_indexes],
-            )
-            for player in self.players:
-                player.react_to_round_summary(round_summary)
+            self._send_round_summary(loser_indexes)
 
             self.start_new_round(
                 first_player_index=next_player,
@@ -202,77 +330,147 @@ class PerudoGame:
             return True  # game is continuing
 
         # Game is not continuing
-        round_summary = RoundSummary.from_game_losers(
+        self._send_round_summary(loser_indexes)
+        return False
+
+    def _send_round_summary(self, loser_indexes: ty.Collection[int]) -> None:
+        """
+        Build the summary of the round that just ended and hand it to the
+        players that care. Building it validates every action and die of the
+        round, so it's skipped entirely if nobody is listening (eg bot only
+        simulations).
+        """
+        if not self._round_summary_players:
+            return
+        round_summary = RoundSummary.from_game_loser_indexes(
             game=self,
-            losers=[self.players[index] for index in loser_indexes],
+            loser_indexes=loser_indexes,
         )
-        for player in self.players:
+        for player in self._round_summary_players:
             player.react_to_round_summary(round_summary)
-        return False
 
     def take_turn(self,) -> bool:
         """
         returns True if the game continues, False if not
         """
-        if self.num_dice_by_player_history[-1][self.cur_player_index] == 0:
-            raise RuntimeError(f"Player index {self.cur_player_index} has no dice left")
-        previous_action = self.get_most_recent_non_noop_action()
-        num_living_players = sum(
-            num_dice != 0
-            for num_dice in self.num_dice_by_player_history[-1]
-        )
+        # The printing lives in the _print_* helpers, called only when
+        # printing, so that bot games skip the string formatting.
+        verbose = self.print_while_playing
+        if verbose:
+            self._print_before_action()
+        previous_action, action = self._get_validated_action()
+        cur_actions = self._cur_actions
+        cur_actions.append(action)
+        if verbose:
+            self._print(f"    {self._typed_names[self.cur_player_index]}: {action}")
+
+        # Handle round ending actions (including InvalidActions)
+        if isinstance(action, actions.EndAction):
+            losers = self._get_losers(previous_action, action)
+            if verbose:
+                self._print(f'Loser(s): {", ".join(self._typed_names[loser] for loser in losers)}')
+            return self.end_round(loser_indexes=losers)
+        assert isinstance(action, actions.Bid), f"Non ending action was not a bid: {action=}"
+        self.cur_round_last_bid = action
+
+        # Dead players between this player and the next living one get a NoOpDead
+        # to keep actions aligned by player index.
+        next_player_index = self.get_next_living_player_index()
+        num_dead_skipped = (next_player_index - self.cur_player_index - 1) % len(self.players)
+        if num_dead_skipped:
+            cur_actions.extend([_NOOP_DEAD] * num_dead_skipped)
+            if verbose:
+                self._print_dead_skipped(num_dead_skipped)
+
+        self.cur_player_index = next_player_index
+        return True
+
+    def _print_before_action(self) -> None:
+        if isinstance(self.players[self.cur_player_index], pl.HumanPlayer):
+            self._flush_print_buffer()  # They need to see what happened before choosing
+
+    def _print_dead_skipped(self, num_dead_skipped: int) -> None:
+        """
+        Print the NoOpDeads for the dead players after the current player
+        """
+        if self.hide_noops:
+            return
+        for offset in range(1, num_dead_skipped + 1):
+            noop_index = (self.cur_player_index + offset) % len(self.players)
+            self._print(f"       (  {self._typed_names[noop_index]}: {_NOOP_DEAD}  )")
+
+    def _get_validated_action(self) -> tuple[actions.Bid | None, actions.Action]:
+        """
+        Get the current player's action.
+
+        :return: The previous bid, and the action (an InvalidAction if the
+            player's action was not valid)
+        """
+        cur_player_index = self.cur_player_index
+        num_dice_by_player_history = self.num_dice_by_player_history
+        if num_dice_by_player_history[-1][cur_player_index] == 0:
+            raise RuntimeError(f"Player index {cur_player_index} has no dice left")
+        previous_action = self.cur_round_last_bid
+        is_single_die_round = self.cur_round_single_die
         observation = pl.ActionObservation(
             previous_action=previous_action,
-            is_single_die_round=self.cur_round_single_die,
+            is_single_die_round=is_single_die_round,
             num_players=len(self.players),
-            num_living_players=num_living_players,
-            num_dice_in_play=sum(self.num_dice_by_player_history[-1]),
-            num_dice_by_player_history=self.num_dice_by_player_history,
+            num_living_players=self._num_living_players,
+            num_dice_in_play=self._num_dice_in_play,
+            num_dice_by_player_history=num_dice_by_player_history,
             all_rounds_actions=self.all_rounds_actions,
-            dice_reveal_history=self.all_rounds_dice_counts[:-1],
+            dice_reveal_history=self._dice_reveal_history,
         )
-        action = self.players[self.cur_player_index].get_action(observation=observation)
+        action = self.players[cur_player_index].get_action(observation=observation)
 
         # Check if the action was valid. Will be an InvalidAction object if not
-        action = action.validate(
-            previous_action=previous_action,
-            is_single_die_round=self.cur_round_single_die,
-        )
-        self.current_round_actions.append(action)
-        if self.print_while_playing:
-            print(f"    {self.players[self.cur_player_index].typed_name}: {action}")
-
-        # Handle round ending actions (including InvalidActions)
-        if isinstance(action, actions.EndAction):
-            all_dice = common.DiceCounts.from_multi_counts(self.current_round_dice_by_player)
-            other_living_players = [
-                player_index
-                for player_index, num_dice in enumerate(self.num_dice_by_player_history[-1])
-                if player_index != self.cur_player_index and num_dice > 0
-            ]
-            losers = action.get_losers(
+        if self._validate_actions[cur_player_index]:
+            action = action.validate(
                 previous_action=previous_action,
-                all_dice_counts=all_dice,
-                is_single_die_round=self.cur_round_single_die,
-                caller=self.cur_player_index,
-                previous_player=self.get_previous_living_player_index(),
-                other_players=other_living_players,
+                is_single_die_round=is_single_die_round,
             )
-            if self.print_while_playing:
-                print(f'Loser(s): {", ".join(self.players[loser].typed_name for loser in losers)}')
-
-            return self.end_round(loser_indexes=losers,)
+        return previous_action, action
 
-        next_player_index = self.get_next_living_player_index()
-        noop_index = (self.cur_player_index + 1) % len(self.players)
-        while noop_index != next_player_index:
-            self.current_round_actions.append(actions.NoOpDead())
-            if self.print_while_playing and not self.hide_noops:
-                print(f"       (  {self.players[noop_index].typed_name}: {actions.NoOpDead()}  )")
-            noop_index = (noop_index + 1) % len(self.players)
+    def _get_losers(
+        self,
+        previous_action: actions.Bid | None,
+        action: actions.EndAction,
+    ) -> list[int]:
+        all_dice = common.DiceCounts.from_multi_counts(self._cur_dice)
+        other_living_players = [
+            player_index
+            for player_index, num_dice in enumerate(self.num_dice_by_player_history[-1])
+            if player_index != self.cur_player_index and num_dice > 0
+        ]
+        return action.get_losers(
+            previous_action=previous_action,
+            all_dice_counts=all_dice,
+            is_single_die_round=self.cur_round_single_die,
+            caller=self.cur_player_index,
+            previous_player=self.get_previous_living_player_index(),
+            other_players=other_living_players,
+        )
 
-        self.cur_player_index = next_player_index
-        return True
+    def reset(self) -> None:
+        """
+        Put the game back to how from_player_list leaves it - everyone has
+        the starting number of dice and no rounds have been played - keeping
+        the same players, in the same order, and settings.
+        """
+        self.num_dice_by_player_history = [[common.STARTING_NUM_DICE for _ in self.players]]
+        self.cur_player_index = -1
+        self.cur_round_single_die = False
+        self.cur_round_last_bid = None
+        self.all_rounds_actions = []
+        self.all_rounds_dice_counts = []
+        self.all_rounds_losers = []
+        self._single_die_mask = 0
+        self._round_count = 0
+        self._cur_actions = []
+        self._cur_dice = []
+        self._print_buffer = io.StringIO()
+        self.__post_init__()  # Rebuilds the living player ring and count
 
     @classmethod
     def from_player_list(
@@ -281,6 +479,7 @@ class PerudoGame:
         print_while_playing: bool=True,
         print_non_human_dice: bool=True,
         shuffle_players: bool=True,
+        record_history: bool=True,
     ) -> ty.Self:
         if shuffle_players:
             players = random.sample(players, len(players))
@@ -292,6 +491,7 @@ class PerudoGame:
             num_dice_by_player_history=[[common.STARTING_NUM_DICE for _ in players]],
             print_while_playing=print_while_playing,
             print_non_human_dice=print_non_human_dice,
+            record_history=record_history,
         )
 
     def print_summary(self) -> None:
@@ -329,8 +529,14 @@ class PerudoGame:
             first_player_index=first_player_index,
             single_die_round=False,  # Assuming we're not being weird.
         )
-        while self.take_turn():
-            pass
+        take_turn = self.take_turn  # Bound once since it's called every turn
+        try:
+            while take_turn():
+                pass
+        finally:
+            # Write out whatever the round printed so far, even if a player
+            # raised - that's the output needed to see what went wrong.
+            self._flush_print_buffer()
 
         # self.cur_player_index is the winner
         if game_end_callback is not None:
@@ -339,7 +545,7 @@ class PerudoGame:
         return self.cur_player_index
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RoundSummary(common.BaseFrozen):
     """
     This class is also a message that will be sent over the network to client
@@ -359,13 +565,32 @@ class RoundSummary(common.BaseFrozen):
         losers: list[pl.PlayerABC],
     ) -> ty.Self:
         return cls(
-            players=[player.name for player in game.players],
+            players=game.player_names.copy(),
             all_player_dice=game.all_rounds_dice_counts[-1],
             all_actions=game.all_rounds_actions[-1],
-            single_die_round=game.single_die_round_history[-1],
+            single_die_round=game.cur_round_single_die,
             losers=[player.name for player in losers],
         )
 
+    @classmethod
+    def from_game_loser_indexes(
+        cls,
+        game: PerudoGame,
+        loser_indexes: ty.Iterable[int],
+    ) -> ty.Self:
+        """
+        As from_game_losers, but with the losers given by player index (as the
+        game has them), so their names come straight from the game.
+        """
+        names = game.player_names
+        return cls(
+            players=names.copy(),
+            all_player_dice=game.all_rounds_dice_counts[-1],
+            all_actions=game.all_rounds_actions[-1],
+            single_die_round=game.cur_round_single_die,
+            losers=[names[index] for index in loser_indexes],
+        )
+
     def print(self, hide_noop:bool=True) -> None:
         pi_pwidth = len(str(len(self.players) - 1))
         print('===================')
@@ -396,7 +621,7 @@ class RoundSummary(common.BaseFrozen):
         print('  -----------------')
         print(f'  Round Loser(s): {", ".join(self.losers)}\n')
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class GameSummary(common.BaseFrozen):
     """
     Note that this class primarily exists so that it can be sent over the
@@ -406,28 +631,30 @@ class GameSummary(common.BaseFrozen):
     all_rounds_dice: list[list[common.DiceCounts]]
     players: list[str]
     all_rounds_losers: list[list[str]]
-    single_die_round_history: list[bool]
+    single_die_round_mask: int  # bit i is set if round i was a single die round
     winner: str
 
+    @property
+    def single_die_round_history(self) -> list[bool]:
+        return common.mask_to_bools(self.single_die_round_mask, len(self.all_rounds_actions))
+
     @classmethod
     def from_game(
         cls,
         game: PerudoGame,
         winner_index: int,
     ) -> ty.Self:
+        names = game.player_names
         return cls(
             all_rounds_actions=game.all_rounds_actions,
             all_rounds_dice=game.all_rounds_dice_counts,
-            players=[player.name for player in game.players],
+            players=names.copy(),
             all_rounds_losers=[
-                [
-                    game.players[player_index].name
-                    for player_index in player_indices
-                ]
+                [names[player_index] for player_index in player_indices]
                 for player_indices in game.all_rounds_losers
             ],
-            single_die_round_history=game.single_die_round_history,
-            winner=game.players[winner_index].name,
+            single_die_round_mask=game.single_die_round_mask,
+            winner=names[winner_index],
         )
 
     def print(self, hide_noop:bool=True) -> None:
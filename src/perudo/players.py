@@ -4,6 +4,7 @@ import dataclasses
 import functools
 import math
 import random
+import sys
 import typing as ty
 
 from perudo import actions
@@ -14,11 +15,23 @@ if ty.TYPE_CHECKING:
 
 type PlayerConstructorType = ty.Callable[[str], 'PlayerABC']
 
+# These actions have no fields, so bots can share single instances rather
+# than making new ones every turn
+_NOOP_FIRST_TURN_SKIP = actions.NoOpFirstTurnSkip()
+_CHALLENGE = actions.Challenge()
+_EXACT = actions.Exact()
+
 
 @dataclasses.dataclass(kw_only=True, frozen=True)
 class ActionObservation(common.BaseFrozen):
     """
     The information available to a player to use to get an action
+
+    The history lists are always in game (global) player order. An
+    observation can also carry a rotation_offset (see rotate), in which case
+    the get_* accessors return rows in local order - with the player at global
+    index rotation_offset at index 0 - building only the row asked for rather
+    than copying the whole history.
     """
     previous_action: actions.Bid | None
     is_single_die_round: bool
@@ -28,32 +41,48 @@ class ActionObservation(common.BaseFrozen):
     num_dice_by_player_history: list[list[int]]
     all_rounds_actions: list[list[actions.Action]]
     dice_reveal_history: list[list[common.DiceCounts]]
+    rotation_offset: int = 0  # Global index of the player at local index 0
 
     def rotate[T: 'ActionObservation'](self: T, index_to_zero: int) -> T:
-        return type(self)(
-            previous_action=self.previous_action,
-            is_single_die_round=self.is_single_die_round,
+        """
+        Return an observation whose accessors treat index_to_zero (in this
+        observation's local order) as index 0. Doesn't copy any history.
+        """
+        return dataclasses.replace(
+            self,
+            rotation_offset=(self.rotation_offset + index_to_zero) % self.num_players,
+        )
+
+    def to_local_index(self, global_index: int) -> int:
+        return (global_index - self.rotation_offset) % self.num_players
+
+    def to_global_index(self, local_index: int) -> int:
+        return (local_index + self.rotation_offset) % self.num_players
+
+    def get_num_dice_by_player(self, round_index: int = -1) -> list[int]:
+        """
+        Number of dice each player had at the start of a round, in local order
+        """
+        return self.rotate_list(self.num_dice_by_player_history[round_index], self.rotation_offset)
+
+    def get_round_actions(self, round_index: int = -1) -> list[actions.Action]:
+        """
+        Actions of a round, padded so that the action at index i was taken by
+        the player at local index i % num_players
+        """
+        return self.pad_rotate_list_of_actions(
+            to_pad=self.all_rounds_actions[round_index],
+            index_to_zero=self.rotation_offset,
             num_players=self.num_players,
-            num_living_players=self.num_living_players,
-            num_dice_in_play=self.num_dice_in_play,
-            num_dice_by_player_history=[
-                self.rotate_list(to_rotate, index_to_zero)
-                for to_rotate in self.num_dice_by_player_history
-            ],
-            all_rounds_actions=[
-                self.pad_rotate_list_of_actions(
-                    to_pad=to_pad,
-                    index_to_zero=index_to_zero,
-                    num_players=self.num_players,
-                )
-                for to_pad in self.all_rounds_actions
-            ],
-            dice_reveal_history=[
-                self.rotate_list(to_rotate, index_to_zero)
-                for to_rotate in self.dice_reveal_history
-            ],
         )
 
+    def get_dice_reveal(self, round_index: int = -1) -> list[common.DiceCounts]:
+        """
+        Dice each player revealed at the end of a (previous) round, in local
+        order
+        """
+        return self.rotate_list(self.dice_reveal_history[round_index], self.rotation_offset)
+
     @staticmethod
     def rotate_list[T](to_rotate: list[T], index_to_zero: int) -> list[T]:
         """
@@ -76,16 +105,26 @@ class ActionObservation(common.BaseFrozen):
         is at index 0 MOD num_players.
         """
         pad_amount = (num_players - index_to_zero) % num_players
-        return [actions.NoOpFirstTurnSkip() for _ in range(pad_amount)] + to_pad
+        return [_NOOP_FIRST_TURN_SKIP] * pad_amount + to_pad
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class PlayerABC:
     NAME_TO_TO_PLAYER_CONSTRUCTOR_D: ty.ClassVar[dict[str, PlayerConstructorType]] = {}
+    # If True, the game does not validate this player's actions, so only set it
+    # on classes whose get_action can't return an invalid one. Not inherited -
+    # a subclass has to set it again itself, since it may change get_action.
+    ACTIONS_ARE_TRUSTED: ty.ClassVar[bool] = False
 
     name: str
     global_index: int | None = None  # index in the game order
     dice_counts: common.DiceCounts = common.DiceCounts.from_empty()
+    # dice_counts as a tuple indexed by face, kept in sync by set_dice
+    _dice_by_face: tuple[int, ...] = dataclasses.field(
+        default=(0,) * (common.MAX_FACE_VAL + 1), init=False, repr=False,
+    )
+    # dice_counts.get_num_dice(), kept in sync by set_dice
+    _num_own_dice: int = dataclasses.field(default=0, init=False, repr=False)
 
     @ty.overload
     @classmethod
@@ -127,6 +166,7 @@ class PlayerABC:
                         'or ClientPlayer.register_player_class(name)(constructor).'
                     )
 
+            name = sys.intern(name)  # Looked up by name a lot, so make the keys cheap to compare
             if isinstance(constructor, type):
                 if not issubclass(constructor, PlayerABC):
                     raise TypeError(error_message)
@@ -142,6 +182,12 @@ class PlayerABC:
 
         return inner(name_or_constructor)
 
+    def __init_subclass__(cls) -> None:
+        # Explicit super, since slots=True makes dataclasses replace the class
+        super(PlayerABC, cls).__init_subclass__()
+        if 'ACTIONS_ARE_TRUSTED' not in cls.__dict__:
+            cls.ACTIONS_ARE_TRUSTED = False
+
     @property
     def typed_name(self) -> str:
         return f"{self.name} ({type(self).__name__})"
@@ -154,7 +200,9 @@ class PlayerABC:
     def rotate_get_action_args_decorator[T: ty.Callable](get_action: T) ->T:
         """
         Use this decorator on a get_action function so that it always receives
-        things in local coordinates (if you want to).
+        things in local coordinates (if you want to) - ie an observation rotated
+        so that this player is index 0. Read it through the observation's get_*
+        accessors; the raw history lists stay in global order.
 
         DO NOT USE THIS ON A METHOD THAT DOES NOT MATCH THE get_action SIGNATURE.
         TODO: fix type hints
@@ -176,6 +224,8 @@ class PlayerABC:
         Set the players dice. Makes a copy out of paranoia. Shouldn't matter.
         """
         self.dice_counts = dice_counts
+        self._dice_by_face = dice_counts.to_face_indexed_tuple()
+        self._num_own_dice = dice_counts.get_num_dice()
 
     @classmethod
     def from_name(cls, name: str) -> ty.Self:
@@ -195,6 +245,14 @@ class PlayerABC:
         """
         pass
 
+    @classmethod
+    def resolve(cls, constructor_name: str) -> PlayerConstructorType:
+        """
+        Get the constructor registered under constructor_name. Look it up once
+        and reuse it if making many players of the same kind.
+        """
+        return cls.NAME_TO_TO_PLAYER_CONSTRUCTOR_D[sys.intern(constructor_name)]
+
     @classmethod
     def from_constructor(
         cls,
@@ -202,18 +260,18 @@ class PlayerABC:
         constructor: PlayerConstructorType | str
     ) -> 'PlayerABC':
         if isinstance(constructor, str):
-            constructor = cls.NAME_TO_TO_PLAYER_CONSTRUCTOR_D[constructor]
+            constructor = cls.resolve(constructor)
         return constructor(player_name)
 
 @PlayerABC.register_constructor
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class HumanPlayer(PlayerABC):
     """
     Gets action from player via use of input
     """
     def get_action(self, observation: ActionObservation,) -> actions.Action:
         fixed_face = None
-        if observation.is_single_die_round and isinstance(observation.previous_action, actions.Bid):
+        if observation.is_single_die_round and observation.previous_action is not None:
             fixed_face = observation.previous_action.face
 
         action: actions.Action
@@ -238,39 +296,43 @@ class HumanPlayer(PlayerABC):
 
     def set_dice(self, dice_counts: common.DiceCounts) -> None:
         print(f"{self.name} dice - {dice_counts.to_str()}")
-        super().set_dice(dice_counts)
+        super(HumanPlayer, self).set_dice(dice_counts)  # Explicit because of slots=True
 
 
 @PlayerABC.register_constructor
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class RandomLegalPlayer(PlayerABC):
     """
     Chooses a random move that's legal and does it. Will never bid more dice than are in play.
     """
+    ACTIONS_ARE_TRUSTED: ty.ClassVar[bool] = True
+
     end_pct_chance: float = 0.5
     exact_pct_change: float = 0.5
 
     def get_end_action(self) -> actions.EndAction:
         if random.random() < self.exact_pct_change:
-            return actions.Exact()
-        return actions.Challenge()
+            return _EXACT
+        return _CHALLENGE
 
     def get_action(self, observation: ActionObservation,) -> actions.Action:
-        if observation.previous_action is not None and random.random() < self.end_pct_chance:
+        # previous_action is typed as a Bid or None, so no isinstance checks
+        previous_action = observation.previous_action
+        if previous_action is not None and random.random() < self.end_pct_chance:
             return self.get_end_action()
 
-        if observation.previous_action is None:
-            face = random.randint(common.MIN_FACE_VAL, common.MAX_FACE_VAL)
+        if previous_action is None:
             # Note: Don't want to assume that the WILD is the MIN, even though
             # that's true and always will be because I'm pedantic as crap.
-            if not observation.is_single_die_round:
-                while face == common.WILD_FACE_VAL:
-                    face = random.randint(common.MIN_FACE_VAL, common.MAX_FACE_VAL)
+            # (NON_WILD_FACES doesn't assume it either.)
+            if observation.is_single_die_round:
+                face = random.randint(common.MIN_FACE_VAL, common.MAX_FACE_VAL)
+            else:
+                face = random.choice(common.NON_WILD_FACES)
             min_count = 1
         else:
             face = random.randint(common.MIN_FACE_VAL, common.MAX_FACE_VAL)
-            assert isinstance(observation.previous_action, actions.Bid)
-            min_count = observation.previous_action.min_next_count(face)
+            min_count = previous_action.min_next_count(face)
 
         if min_count > observation.num_dice_in_play:
             return self.get_end_action()
@@ -279,63 +341,111 @@ class RandomLegalPlayer(PlayerABC):
         return actions.Bid(face=face, count=count)
 
 
-@PlayerABC.register_constructor
-@dataclasses.dataclass(kw_only=True)
-class ProbabilisticPlayer(PlayerABC):
+# The whole distribution is cached per (number of other dice, p), since bots ask
+# about the same one over and over - across faces, turns, players, and games.
+# p is only ever 1/6 or 1/3, and the dice in play are bounded, so the cache
+# stays small.
+@functools.lru_cache(maxsize=256)
+def _binomial_table(num_trials: int, p: float) -> tuple[tuple[float, ...], tuple[float, ...]]:
     """
-    Player bot who only uses some basic probabilities to decide what to do.
+    The binomial distribution for num_trials independent trials, each
+    succeeding with probability p, as (exact, below): exact[k] is the
+    probability of exactly k successes, and below[k] of fewer than k (so
+    below has one more entry than exact).
     """
+    q = 1 - p
+    odds = p / q
+    # Each term comes from the previous one:
+    #   term(k + 1) = term(k) * (num_trials - k) / (k + 1) * p / q
+    # so there's no comb or pow in the loop.
+    term = q ** num_trials  # term(0)
+    exact: list[float] = []
+    for k in range(num_trials + 1):
+        exact.append(term)
+        term *= (num_trials - k) / (k + 1) * odds
+    # Sum each tail with fsum rather than a running +=, so that rounding error
+    # can't build up and flip near-tied decisions. It's quadratic, but only
+    # runs once per table.
+    below = tuple(math.fsum(exact[:k]) for k in range(num_trials + 2))
+    return tuple(exact), below
+
+
+def _binomial_probs_below_and_exact(num_successes: int, num_trials: int, p: float) -> tuple[float, float]:
+    """
+    Probabilities of fewer than num_successes successes, and of exactly
+    num_successes successes, in num_trials independent trials, each
+    succeeding with probability p.
+    """
+    return _probs_below_and_exact_from_table(_binomial_table(num_trials, p), num_successes)
 
-    def _get_prob_of_challenge_success(
-        self,
-        face: int,
-        count: int,
-        is_single_die_round: bool,
-        num_other_dice: int,
-    ) -> float:
-        if self.dice_counts[face] >= count:
-            return 0
 
-        if is_single_die_round or face == common.WILD_FACE_VAL:
-            p = 1/6
-        else:
-            p = 1/3
+def _probs_below_and_exact_from_table(
+    table: tuple[tuple[float, ...], tuple[float, ...]],
+    num_successes: int,
+) -> tuple[float, float]:
+    """
+    As _binomial_probs_below_and_exact, but reading from a table already
+    fetched from _binomial_table (for callers asking about several counts).
+    """
+    if num_successes < 0:
+        return 0.0, 0.0
+    exact, below = table
+    if num_successes >= len(exact):
+        return below[-1], 0.0
+    return below[num_successes], exact[num_successes]
 
-        needed_from_others = count - self.dice_counts[face]
 
-        prob = 0.0
-        for k in range(0, needed_from_others):
-            prob += math.comb(num_other_dice, k) * (p ** k) * ((1 - p) ** (num_other_dice - k))
+def clear_prob_caches() -> None:
+    """
+    Empty the caches of the probability helpers used by ProbabilisticPlayer
+    (eg for tests, or to free memory after a big simulation)
+    """
+    _binomial_table.cache_clear()
 
-        return prob
 
-    def _get_prob_of_exact_count(
-        self,
-        face: int,
-        count: int,
-        is_single_die_round: bool,
-        num_other_dice: int,
-    ) -> float:
-        # How many matching dice we need from others
-        needed_from_others = count - self.dice_counts[face]
+@PlayerABC.register_constructor
+@dataclasses.dataclass(kw_only=True, slots=True)
+class ProbabilisticPlayer(PlayerABC):
+    """
+    Player bot who only uses some basic probabilities to decide what to do.
+    """
+    ACTIONS_ARE_TRUSTED: ty.ClassVar[bool] = True
 
-        # Edge cases
-        if needed_from_others < 0:
-            return 0.0  # We already have more than needed
-        if needed_from_others > num_other_dice:
-            return 0.0  # Not enough dice to reach count
+    # If challenging (or calling exact) on the previous bid is more likely than
+    # this to work, just do it without looking at any bids. This is a policy
+    # choice as well as a shortcut - a bid could occasionally have scored
+    # higher. Set to 1 or more to always look at every bid.
+    challenge_dominance_threshold: float = 0.75
+    exact_dominance_threshold: float = 0.75
 
-        # Set matching probability
+    @staticmethod
+    def _get_match_prob(face: int, is_single_die_round: bool) -> float:
+        """
+        Probability that one of someone else's dice counts towards a bid on
+        face
+        """
         if is_single_die_round or face == common.WILD_FACE_VAL:
-            p = 1 / 6
-        else:
-            p = 1 / 3
+            return 1/6
+        return 1/3
 
-        # Single binomial term
-        prob = math.comb(num_other_dice, needed_from_others) * (p ** needed_from_others) * (
-                (1 - p) ** (num_other_dice - needed_from_others))
+    @staticmethod
+    def _get_probs_of_challenge_success_and_exact(
+        own: int,
+        count: int,
+        p: float,
+        num_other_dice: int,
+    ) -> tuple[float, float]:
+        """
+        Probabilities that a challenge of a bid would succeed (fewer than count
+        matching dice), and that the count is exact.
 
-        return prob
+        :param own: How many matching dice this player has for the bid's face
+        :param p: Match probability for the bid's face, see _get_match_prob
+        """
+        # How many matching dice we need from others. If negative, we already
+        # have more than enough, so both probabilities are 0.
+        needed_from_others = count - own
+        return _binomial_probs_below_and_exact(needed_from_others, num_other_dice, p)
 
     @staticmethod
     def _get_opening_bid(
@@ -355,11 +465,10 @@ class ProbabilisticPlayer(PlayerABC):
         :return: Chosen opening bid action
         """
         if is_single_die_round:
-            face = common.get_random_face()
-            count = non_wild_avg_count
+            face = random.choice(common.ALL_FACES)
         else:
-            face = common.get_random_non_wild_face()
-            count = non_wild_avg_count
+            face = random.choice(common.NON_WILD_FACES)
+        count = non_wild_avg_count
 
         return actions.Bid(face=face, count=math.ceil(count / 2))
 
@@ -377,46 +486,56 @@ class ProbabilisticPlayer(PlayerABC):
         #       the right play at that time) or because the calculations for
         #       expected value are wrong?
 
-        p_challenge = self._get_prob_of_challenge_success(
-            face=previous_bid.face,
-            count=previous_bid.count,
-            is_single_die_round=is_single_die_round,
-            num_other_dice=num_other_dice,
-        )
-        p_exact = self._get_prob_of_exact_count(
-            face=previous_bid.face,
+        # The match probability only depends on whether the face is wild
+        # (everything is 1/6 in a single die round), so work both out once.
+        wild_p = self._get_match_prob(common.WILD_FACE_VAL, is_single_die_round)
+        non_wild_p = self._get_match_prob(common.WILD_FACE_VAL + 1, is_single_die_round)
+
+        p = wild_p if previous_bid.face == common.WILD_FACE_VAL else non_wild_p
+        dice_by_face = self._dice_by_face
+        p_challenge, p_exact = self._get_probs_of_challenge_success_and_exact(
+            own=dice_by_face[previous_bid.face],
             count=previous_bid.count,
-            is_single_die_round=is_single_die_round,
+            p=p,
             num_other_dice=num_other_dice,
         )
+        if p_challenge > self.challenge_dominance_threshold:
+            return _CHALLENGE
+        if p_exact > self.exact_dominance_threshold:
+            return _EXACT
         # e_challenge = p_challenge - (1 - p_challenge)
         # e_exact = p_exact * (num_players_alive - 1) - (1 - p_exact)
         # TODO compare to e_ version
-        actions_values: list[tuple[actions.Action, float]] = [
-            (actions.Challenge(), p_challenge),
-            (actions.Exact(), p_exact),
-        ]
+        # Only strictly better actions replace the best so far, so ties go to
+        # the earliest: challenge, then exact, then bids in face order.
+        best_action: actions.Action = _CHALLENGE
+        best_value = p_challenge
+        if p_exact > best_value:
+            best_action = _EXACT
+            best_value = p_exact
 
         # For bids, the expected value is calculated assuming the next player
         # challenges
-        allowed_faces: ty.Iterable[int]
+        candidates: ty.Iterable[tuple[int, int]]  # (face, min count) pairs
         if is_single_die_round:
-            allowed_faces = (previous_bid.face,)
+            candidates = ((previous_bid.face, previous_bid.min_next_count(previous_bid.face)),)
         else:
-            allowed_faces = range(common.MIN_FACE_VAL, common.MAX_FACE_VAL + 1)
-        for face in allowed_faces:
-            min_count = previous_bid.min_next_count(face)
-            p_challenge = self._get_prob_of_challenge_success(
-                face=face,
-                count=min_count,
-                is_single_die_round=is_single_die_round,
-                num_other_dice=num_other_dice,
-            )
-            p_exact = self._get_prob_of_exact_count(
-                face=face,
-                count=min_count,
-                is_single_die_round=is_single_die_round,
-                num_other_dice=num_other_dice,
+            candidates = zip(common.ALL_FACES, previous_bid.min_next_counts())
+        # Every candidate reads from one of the same two distributions, so
+        # fetch them once. Bound locally since this loop runs on every turn.
+        wild_table = _binomial_table(num_other_dice, wild_p)
+        non_wild_table = _binomial_table(num_other_dice, non_wild_p)
+        probs_below_and_exact_from_table = _probs_below_and_exact_from_table
+        wild_face = common.WILD_FACE_VAL
+        # The winning bid's face and count, if a bid wins. The Bid is only made
+        # once the search is over.
+        best_face: int | None = None
+        best_count = 0
+        for face, min_count in candidates:
+            # Challenge succeeds if others have fewer than the count minus our own
+            p_challenge, p_exact = probs_below_and_exact_from_table(
+                wild_table if face == wild_face else non_wild_table,
+                min_count - dice_by_face[face],
             )
             # Here, challenge succeeding is valued at -1, and failing at +1.
             # We could say that the other guy doing an exact is better for us
@@ -426,12 +545,18 @@ class ProbabilisticPlayer(PlayerABC):
             # e_exact = -p_exact + (1 - p_exact)
 
             # TODO compare to e_ version
-            actions_values.append((actions.Bid(face=face, count=min_count), min(1 - p_challenge, 1 - p_exact)))
+            value = 1 - max(p_challenge, p_exact)  # min(1 - p_challenge, 1 - p_exact)
+            if value > best_value:
+                best_face = face
+                best_count = min_count
+                best_value = value
 
-        return max(actions_values, key=lambda x: x[1])[0]
+        if best_face is not None:
+            return actions.Bid(face=best_face, count=best_count)
+        return best_action
 
     def get_action(self, observation: ActionObservation,) -> actions.Action:
-        num_other_dice = observation.num_dice_in_play - self.dice_counts.get_num_dice()
+        num_other_dice = observation.num_dice_in_play - self._num_own_dice
         if num_other_dice == 0:
             return actions.InvalidAction('NO BASE', "No other players have dice")
 
@@ -440,16 +565,16 @@ class ProbabilisticPlayer(PlayerABC):
         else:
             non_wild_avg_count = num_other_dice / common.NUM_FACES
 
-        if observation.previous_action is None:
+        previous_action = observation.previous_action
+        if previous_action is None:
             return self._get_opening_bid(
                 is_single_die_round=observation.is_single_die_round,
                 non_wild_avg_count=non_wild_avg_count,
             )
 
-        assert isinstance(observation.previous_action, actions.Bid)
         return self._get_expected_best_action(
-            previous_bid=observation.previous_action,
+            previous_bid=previous_action,
             is_single_die_round=observation.is_single_die_round,
             num_other_dice=num_other_dice,
-            num_players_alive=sum(count != 0 for count in observation.num_dice_by_player_history[-1]),
+            num_players_alive=observation.num_living_players,
         )
@@ -3,6 +3,8 @@ Some tests, mostly ai generated because I'm lazy (but I did read them). A few
 modified or added.
 """
 
+import math
+
 import pytest
 
 from perudo import actions
@@ -10,17 +12,31 @@ from perudo import common
 from perudo import perudo_game as pg
 from perudo import players as pl
 
+# Dice used by the get_losers tests, named by their faces. Built once here
+# rather than in every test.
+DICE_1_2_2_6 = common.DiceCounts.from_dictionary({1:1, 2:2, 6:1})
+DICE_1_2_3_6 = common.DiceCounts.from_dictionary({3:1, 2:1, 1:1, 6:1})
+DICE_1_3_3_6 = common.DiceCounts.from_dictionary({3:2, 1:1, 6:1})
+DICE_2_2_3_6 = common.DiceCounts.from_dictionary({3:1, 2:2, 6:1})
+DICE_2_3_3_6 = common.DiceCounts.from_dictionary({3:2, 2:1, 6:1})
+
 
 @pytest.fixture
 def simple_bid() -> actions.Bid:
     return actions.Bid(face=2, count=2)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_game() -> pg.PerudoGame:
     players: list[pl.PlayerABC] = [pl.RandomLegalPlayer(name=f"Bot-{i}") for i in range(2)]
     game = pg.PerudoGame.from_player_list(players)
     return game
 
+@pytest.fixture
+def fresh_game(simple_game: pg.PerudoGame) -> pg.PerudoGame:
+    """simple_game, reset for tests that play on it"""
+    simple_game.reset()
+    return simple_game
+
 def test_bid_validation_first_move_valid(simple_bid: actions.Bid) -> None:
     action = simple_bid.validate(previous_action=None, is_single_die_round=False)
     assert isinstance(action, actions.Bid)
@@ -43,25 +59,28 @@ def test_bid_min_next_count_wild_base() -> None:
     assert bid.min_next_count(common.WILD_FACE_VAL + 1) == 7  # Higher face -> same count
     assert bid.min_next_count(common.WILD_FACE_VAL + 2) == 7  # Lower -> wrap around ceil(count/2)*2 + 1
 
-def test_challenge_success() -> None:
-    previous = actions.Bid(face=3, count=2)
-    dice_counts = common.DiceCounts.from_dictionary({3:2, 2:1, 6:1})
-    challenge = actions.Challenge()
-    losers = challenge.get_losers(
-        previous_action=previous,
-        all_dice_counts=dice_counts,
-        is_single_die_round=False,
-        caller=0,
-        previous_player=1,
-        other_players=[1]
-    )
-    assert losers == [0]  # Caller loses because bid was valid
-
-def test_challenge_failure() -> None:
-    previous = actions.Bid(face=3, count=3)
-    dice_counts = common.DiceCounts.from_dictionary({3:1, 2:2, 6:1})
-    challenge = actions.Challenge()
-    losers = challenge.get_losers(
+def test_bid_min_next_counts_matches_min_next_count() -> None:
+    for face in common.ALL_FACES:
+        for count in (1, 7, 1000):  # 1000 is past the precomputed table
+            bid = actions.Bid(face=face, count=count)
+            assert bid.min_next_counts() == tuple(bid.min_next_count(next_face) for next_face in common.ALL_FACES)
+            assert bid.min_next_counts() == actions._get_min_next_counts(face, count)
+
+@pytest.mark.parametrize(
+    ("previous", "dice_counts", "expected_losers"),
+    [
+        # Caller loses because bid was valid
+        pytest.param(actions.Bid(face=3, count=2), DICE_2_3_3_6, [0], id="success"),
+        # Previous player loses because bid was invalid
+        pytest.param(actions.Bid(face=3, count=3), DICE_2_2_3_6, [1], id="failure"),
+    ],
+)
+def test_challenge(
+    previous: actions.Bid,
+    dice_counts: common.DiceCounts,
+    expected_losers: list[int],
+) -> None:
+    losers = actions.Challenge().get_losers(
         previous_action=previous,
         all_dice_counts=dice_counts,
         is_single_die_round=False,
@@ -69,100 +88,158 @@ def test_challenge_failure() -> None:
         previous_player=1,
         other_players=[1]
     )
-    assert losers == [1]  # Previous player loses because bid was invalid
-
-def test_exact_success_no_wild() -> None:
-    previous = actions.Bid(face=2, count=2)
-    dice_counts = common.DiceCounts.from_dictionary({3:1, 2:2, 6:1})
-    exact = actions.Exact()
-    losers = exact.get_losers(
-        previous_action=previous,
-        all_dice_counts=dice_counts,
-        is_single_die_round=False,
-        caller=0,
-        previous_player=4,
-        other_players=[1, 2, 3, 4]
-    )
-    assert losers == [1, 2, 3, 4]  # All non caller players lose because bid was exact
-
-def test_exact_success_with_wild() -> None:
-    previous = actions.Bid(face=2, count=2)
-    dice_counts = common.DiceCounts.from_dictionary({3:1, 2:1, 1:1, 6:1})
-    exact = actions.Exact()
-    losers = exact.get_losers(
+    assert losers == expected_losers
+
+@pytest.mark.parametrize(
+    ("previous", "dice_counts", "is_single_die_round", "expected_losers"),
+    [
+        # All non caller players lose because bid was exact
+        pytest.param(actions.Bid(face=2, count=2), DICE_2_2_3_6, False, [1, 2, 3, 4], id="success_no_wild"),
+        pytest.param(actions.Bid(face=2, count=2), DICE_1_2_3_6, False, [1, 2, 3, 4], id="success_with_wild"),
+        pytest.param(actions.Bid(face=2, count=2), DICE_1_2_2_6, True, [1, 2, 3, 4], id="success_disabled_wild"),
+        # Caller loses because exact call failed
+        pytest.param(actions.Bid(face=3, count=2), DICE_2_2_3_6, False, [0], id="failure_no_wild"),
+        pytest.param(actions.Bid(face=3, count=2), DICE_1_3_3_6, False, [0], id="failure_with_wild"),
+        pytest.param(actions.Bid(face=3, count=2), DICE_1_2_3_6, True, [0], id="failure_disabled_wild"),
+    ],
+)
+def test_exact(
+    previous: actions.Bid,
+    dice_counts: common.DiceCounts,
+    is_single_die_round: bool,
+    expected_losers: list[int],
+) -> None:
+    losers = actions.Exact().get_losers(
         previous_action=previous,
         all_dice_counts=dice_counts,
-        is_single_die_round=False,
+        is_single_die_round=is_single_die_round,
         caller=0,
         previous_player=4,
         other_players=[1, 2, 3, 4]
     )
-    assert losers == [1, 2, 3, 4]  # All non caller players lose because bid was exact
-
-def test_exact_success_disabled_wild() -> None:
-    previous = actions.Bid(face=2, count=2)
-    dice_counts = common.DiceCounts.from_dictionary({1:1, 2:2, 6:1})
-    exact = actions.Exact()
-    losers = exact.get_losers(
-        previous_action=previous,
-        all_dice_counts=dice_counts,
-        is_single_die_round=True,
-        caller=0,
-        previous_player=4,
-        other_players=[1, 2, 3, 4]
-    )
-    assert losers == [1, 2, 3, 4]  # All non caller players lose because bid was exact
-
-def test_exact_failure_no_wild() -> None:
-    previous = actions.Bid(face=3, count=2)
-    dice_counts = common.DiceCounts.from_dictionary({3:1, 2:2, 6:1})
-    exact = actions.Exact()
-    losers = exact.get_losers(
-        previous_action=previous,
-        all_dice_counts=dice_counts,
+    assert losers == expected_losers
+
+def test_dice_counts_from_multi_counts() -> None:
+    combined = common.DiceCounts.from_multi_counts([
+        common.DiceCounts.from_dictionary({1: 1, 3: 2}),
+        common.DiceCounts.from_dictionary({3: 1, 6: 4}),
+    ])
+    assert combined == common.DiceCounts.from_dictionary({1: 1, 3: 3, 6: 4})
+    assert common.DiceCounts.from_multi_counts([]) == common.DiceCounts.from_empty()
+
+def test_perudogame_start_new_round(fresh_game: pg.PerudoGame) -> None:
+    fresh_game.start_new_round(first_player_index=0, single_die_round=False)
+    assert fresh_game.cur_player_index == 0
+    assert fresh_game.current_round_dice_by_player  # Players should have dice
+    assert fresh_game.all_rounds_actions[-1] == []
+    assert fresh_game.cur_round_last_bid is None
+
+def test_perudogame_take_turn(fresh_game: pg.PerudoGame) -> None:
+    fresh_game.start_new_round(first_player_index=0, single_die_round=False)
+    still_going = fresh_game.take_turn()
+    assert isinstance(still_going, bool)
+    assert fresh_game.current_round_actions  # Some action should have been taken
+    # The first action of a round is always a bid
+    assert fresh_game.cur_round_last_bid is fresh_game.current_round_actions[-1]
+
+def test_perudogame_single_die_round_history(fresh_game: pg.PerudoGame) -> None:
+    fresh_game.start_new_round(first_player_index=0, single_die_round=False)
+    fresh_game.start_new_round(first_player_index=1, single_die_round=True)
+    fresh_game.start_new_round(first_player_index=0, single_die_round=False)
+    assert fresh_game.single_die_round_history == [False, True, False]
+
+def test_perudogame_reset() -> None:
+    players: list[pl.PlayerABC] = [pl.RandomLegalPlayer(name=f"Bot-{i}") for i in range(3)]
+    game = pg.PerudoGame.from_player_list(players, print_while_playing=False)
+    game.main_loop()
+    game.reset()
+    assert game.num_dice_by_player_history == [[common.STARTING_NUM_DICE] * 3]
+    assert game.num_living_players == 3
+    assert game.all_rounds_actions == []
+    assert game.single_die_round_history == []
+    game.main_loop()  # Can play again
+    assert game.num_living_players == 1
+
+def test_perudogame_no_record_history() -> None:
+    players: list[pl.PlayerABC] = [pl.RandomLegalPlayer(name=f"Bot-{i}") for i in range(3)]
+    game = pg.PerudoGame.from_player_list(players, print_while_playing=False, record_history=False)
+    game.main_loop()
+    assert len(game.all_rounds_actions) == 1
+    assert len(game.all_rounds_dice_counts) == 1
+    assert len(game.all_rounds_losers) == 1
+    assert len(game.single_die_round_history) == 1
+
+def test_perudogame_living_player_indexes_skip_dead() -> None:
+    players: list[pl.PlayerABC] = [pl.RandomLegalPlayer(name=f"Bot-{i}") for i in range(4)]
+    game = pg.PerudoGame(players=players, num_dice_by_player_history=[[5, 0, 5, 0]])
+    game.cur_player_index = 0
+    assert game.get_next_living_player_index() == 2
+    assert game.get_previous_living_player_index() == 2
+    game.cur_player_index = 1  # Dead players still find their living neighbors
+    assert game.get_next_living_player_index() == 2
+    assert game.get_previous_living_player_index() == 0
+    assert game.num_living_players == 2
+
+    game.start_new_round(first_player_index=0, single_die_round=False)
+    game.num_dice_by_player_history[-1][2] = 1
+    assert not game.end_round(loser_indexes=[2])
+    assert game.num_living_players == 1
+    game.cur_player_index = 0
+    with pytest.raises(RuntimeError):
+        game.get_next_living_player_index()
+
+def test_binomial_probs_match_direct_sum() -> None:
+    pl.clear_prob_caches()
+    for p in (1/6, 1/3):
+        for num_other_dice in range(0, 25):
+            for needed in range(0, num_other_dice + 2):
+                direct_below = sum(
+                    math.comb(num_other_dice, k) * p**k * (1 - p)**(num_other_dice - k)
+                    for k in range(needed)
+                )
+                direct_exact = math.comb(num_other_dice, needed) * p**needed * (1 - p)**(num_other_dice - needed)
+                below, exact = pl._binomial_probs_below_and_exact(needed, num_other_dice, p)
+                assert below == pytest.approx(direct_below)
+                assert exact == pytest.approx(direct_exact)
+    assert pl._binomial_probs_below_and_exact(-1, 5, 1/3) == (0.0, 0.0)
+    pl.clear_prob_caches()
+    assert pl._binomial_table.cache_info().currsize == 0
+
+def test_action_observation_rotate() -> None:
+    bid = actions.Bid(face=2, count=1)
+    observation = pl.ActionObservation(
+        previous_action=bid,
         is_single_die_round=False,
-        caller=0,
-        previous_player=4,
-        other_players=[1, 2, 3, 4]
+        num_players=3,
+        num_living_players=3,
+        num_dice_in_play=12,
+        num_dice_by_player_history=[[5, 5, 5], [3, 4, 5]],
+        all_rounds_actions=[[actions.NoOpFirstTurnSkip(), bid]],
+        dice_reveal_history=[],
     )
-    assert losers == [0]  # Caller loses because exact call failed
-
-def test_exact_failure_with_wild() -> None:
-    previous = actions.Bid(face=3, count=2)
-    dice_counts = common.DiceCounts.from_dictionary({3:2, 1:1, 6:1})
-    exact = actions.Exact()
-    losers = exact.get_losers(
-        previous_action=previous,
-        all_dice_counts=dice_counts,
-        is_single_die_round=False,
-        caller=0,
-        previous_player=4,
-        other_players=[1, 2, 3, 4]
-    )
-    assert losers == [0]  # Caller loses because exact call failed
-
-def test_exact_failure_disabled_wild() -> None:
-    previous = actions.Bid(face=3, count=2)
-    dice_counts = common.DiceCounts.from_dictionary({3:1, 2:1, 1:1, 6:1})
-    exact = actions.Exact()
-    losers = exact.get_losers(
-        previous_action=previous,
-        all_dice_counts=dice_counts,
-        is_single_die_round=True,
-        caller=0,
-        previous_player=4,
-        other_players=[1, 2, 3, 4]
-    )
-    assert losers == [0]  # Caller loses because exact call failed
-
-def test_perudogame_start_new_round(simple_game: pg.PerudoGame) -> None:
-    simple_game.start_new_round(first_player_index=0, single_die_round=False)
-    assert simple_game.cur_player_index == 0
-    assert simple_game.current_round_dice_by_player  # Players should have dice
-    assert simple_game.all_rounds_actions[-1] == []
-
-def test_perudogame_take_turn(simple_game: pg.PerudoGame) -> None:
-    simple_game.start_new_round(first_player_index=0, single_die_round=False)
-    still_going = simple_game.take_turn()
-    assert isinstance(still_going, bool)
-    assert simple_game.current_round_actions  # Some action should have been taken
+    rotated = observation.rotate(index_to_zero=1)
+    assert rotated.num_dice_by_player_history is observation.num_dice_by_player_history  # Nothing copied
+    assert rotated.get_num_dice_by_player() == [4, 5, 3]
+    assert rotated.get_round_actions(0) == [actions.NoOpFirstTurnSkip(), actions.NoOpFirstTurnSkip(), actions.NoOpFirstTurnSkip(), bid]
+    assert rotated.to_global_index(0) == 1
+    assert rotated.rotate(index_to_zero=2).get_num_dice_by_player() == observation.get_num_dice_by_player()
+
+def test_round_summary_from_losers_matches_from_loser_indexes() -> None:
+    players: list[pl.PlayerABC] = [pl.RandomLegalPlayer(name=f"Bot-{i}") for i in range(3)]
+    game = pg.PerudoGame.from_player_list(players, print_while_playing=False)
+    game.start_new_round(first_player_index=0, single_die_round=False)
+    by_player = pg.RoundSummary.from_game_losers(game=game, losers=[game.players[2]])
+    by_index = pg.RoundSummary.from_game_loser_indexes(game=game, loser_indexes=[2])
+    assert by_player == by_index
+    assert by_player.losers == [game.players[2].name]
+
+def test_perudogame_main_loop_flushes_output_on_error(capsys: pytest.CaptureFixture[str]) -> None:
+    class BrokenPlayer(pl.RandomLegalPlayer):
+        def get_action(self, observation: pl.ActionObservation) -> actions.Action:
+            raise RuntimeError("broken bot")
+
+    players: list[pl.PlayerABC] = [BrokenPlayer(name="Broken"), BrokenPlayer(name="Also-Broken")]
+    game = pg.PerudoGame.from_player_list(players, print_while_playing=True)
+    with pytest.raises(RuntimeError, match="broken bot"):
+        game.main_loop()
+    assert "Starting new round" in capsys.readouterr().out
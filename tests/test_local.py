@@ -0,0 +1,24 @@
+"""
+Tests for the local CLI's batch mode.
+"""
+
+from perudo.cli import local
+
+
+def test_run_many_games() -> None:
+    wins = local.run_many_games(
+        [("a", "RandomLegalPlayer"), ("b", "RandomLegalPlayer")],
+        num_games=8,
+        num_workers=1,
+    )
+    assert sum(wins.values()) == 8
+    assert set(wins) <= {"a", "b"}
+
+def test_local_main_rejects_bad_batch_args() -> None:
+    parser = local.make_parser()
+    human_args = parser.parse_args(["--ap", "HumanPlayer", "RandomLegalPlayer", "--n-games", "3"])
+    assert local.main(human_args) == 1
+    zero_worker_args = parser.parse_args(["--n-random", "2", "--n-games", "3", "--n-workers", "0"])
+    assert local.main(zero_worker_args) == 1
+    zero_game_args = parser.parse_args(["--n-random", "2", "--n-games", "0"])
+    assert local.main(zero_game_args) == 1